@@ -0,0 +1,11 @@
+import hashlib
+
+EMAIL_CHECK_CACHE_TIMEOUT = 30
+
+
+def email_check_cache_key(email: str) -> str:
+    """
+    Cache key for the email-check payload of a (lowercased) email address.
+    Hashed so arbitrary addresses are valid keys for every cache backend.
+    """
+    return "email-check:" + hashlib.md5(email.encode()).hexdigest()
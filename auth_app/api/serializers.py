@@ -1,7 +1,12 @@
+import re
+
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
+EMAIL_TAKEN_MESSAGE = "Ein Benutzer mit dieser E-Mail existiert bereits."
+
 
 class RegistrationSerializer(serializers.ModelSerializer):
     """
@@ -32,11 +37,12 @@ class RegistrationSerializer(serializers.ModelSerializer):
 
         validate_password(attrs["password"])
 
-        email = attrs.get("email")
+        email = (attrs.get("email") or "").strip().lower()
         if not email:
             raise serializers.ValidationError({"email": "E-Mail-Adresse ist erforderlich."})
-        if User.objects.filter(email__iexact=email).exists():
-            raise serializers.ValidationError({"email": "Ein Benutzer mit dieser E-Mail existiert bereits."})
+        if User.objects.filter(email=email).exists():
+            raise serializers.ValidationError({"email": EMAIL_TAKEN_MESSAGE})
+        attrs["email"] = email
 
         return attrs
 
@@ -51,47 +57,48 @@ class RegistrationSerializer(serializers.ModelSerializer):
         password = validated_data.pop("password")
         validated_data.pop("repeated_password", None)
 
-        email = validated_data.get("email", "").strip()
+        email = validated_data.get("email", "")  # normalized in validate()
 
         base_username = email.split("@")[0] if email else "user"
-        username = base_username
-        counter = 1
-        while User.objects.filter(username=username).exists():
-            username = f"{base_username}{counter}"
-            counter += 1
+        # The prefix filter can use the username index; the regex then
+        # only keeps `base`, `base1`, `base2`, ... among those rows.
+        taken = set(
+            User.objects.filter(username__startswith=base_username)
+            .filter(username__regex=rf"^{re.escape(base_username)}\d*$")
+            .values_list("username", flat=True)
+        )
 
-        first_name = ""
-        last_name = ""
-        if fullname:
-            parts = fullname.split(" ", 1)
-            first_name = parts[0]
-            if len(parts) > 1:
-                last_name = parts[1]
+        first_name, _, last_name = fullname.partition(" ")
 
         user = User(
-            username=username,
             email=email,
             first_name=first_name,
             last_name=last_name,
         )
         user.set_password(password)
-        user.save()
-        return user
 
-class LoginSerializer(serializers.Serializer):
-    """
-    Serializer used for user login.
-    Expects:
-    - email: user email address
-    - password: plain text password
-    """
-    email = serializers.EmailField(required=True)
-    password = serializers.CharField(write_only=True, required=True)
+        while True:
+            user.username = self._next_free_username(base_username, taken)
+            try:
+                with transaction.atomic():
+                    user.save()
+                return user
+            except IntegrityError:
+                # A concurrent registration won the race for this email
+                # (auth_user_email_ci_uniq) or for the username.
+                if User.objects.filter(email=email).exists():
+                    raise serializers.ValidationError({"email": EMAIL_TAKEN_MESSAGE})
+                if not User.objects.filter(username=user.username).exists():
+                    raise
+                taken.add(user.username)
 
-class EmailCheckSerializer(serializers.Serializer):
-    """
-    Serializer used to check if an email address is already registered.
-    Expects:
-    - email: user email address
-    """
-    email = serializers.EmailField(required=True)
\ No newline at end of file
+    def _next_free_username(self, base_username, taken):
+        """
+        Return the first of base_username, base_username1, ... not in `taken`.
+        """
+        username = base_username
+        counter = 1
+        while username in taken:
+            username = f"{base_username}{counter}"
+            counter += 1
+        return username
@@ -0,0 +1,11 @@
+from rest_framework.throttling import UserRateThrottle
+
+
+class EmailCheckThrottle(UserRateThrottle):
+    """
+    Per-user burst limit for the email check endpoint, which forms may
+    call on every keystroke.
+    """
+
+    scope = "email_check"
+    rate = "30/min"
@@ -1,16 +1,143 @@
+import hashlib
+from collections.abc import Mapping
+from functools import lru_cache
+
+from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import EmailValidator
+from django.utils.http import parse_etags
 
 from rest_framework import permissions, status
 from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .serializers import RegistrationSerializer, LoginSerializer, EmailCheckSerializer
+from core.renderers import ORJSONRenderer
+from core.utils import format_display_name
+
+from .cache_keys import EMAIL_CHECK_CACHE_TIMEOUT, email_check_cache_key
+from .serializers import RegistrationSerializer
+from .throttles import EmailCheckThrottle
+
+_EMAIL_VALIDATOR = EmailValidator()
+
+# Columns needed to build the auth response payloads (see _get_fullname).
+_USER_PAYLOAD_FIELDS = ("id", "email", "first_name", "last_name", "username")
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """
+    Hash checked against when a login email is unknown, so that both
+    failure paths run the password hasher and take the same time.
+    Computed on first use to keep the hashing cost out of import time.
+    """
+    return make_password("!" * 12)
+
+
+def _strip_weak(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """
+    Weak comparison of `etag` against an If-None-Match header, as
+    RFC 9110 requires for that header; `*` matches any current payload.
+    """
+    etags = parse_etags(if_none_match)
+    if "*" in etags:
+        return True
+    return _strip_weak(etag) in {_strip_weak(tag) for tag in etags}
+
 
 def _get_fullname(user: User) -> str:
-    name = (user.first_name + " " + user.last_name).strip()
-    return name or user.username
+    return format_display_name(user.first_name, user.last_name, user.username)
+
+
+def _get_fullname_cached(request, user: User) -> str:
+    """
+    Return `_get_fullname(user)`, memoized per request by user id.
+    """
+    fullnames = request.__dict__.setdefault("_fullname_cache", {})
+    if user.id not in fullnames:
+        fullnames[user.id] = _get_fullname(user)
+    return fullnames[user.id]
+
+
+def _get_token_key(user: User) -> str:
+    """
+    Return the key of the user's auth token, creating the token if missing.
+    Expects the token to be joined onto `user` via
+    select_related("auth_token"), as LoginView does.
+    """
+    token = getattr(user, "auth_token", None)
+    if token is None:
+        token = Token.objects.create(user=user)
+    return token.key
+
+
+def _clean_str(data, field: str, errors: dict) -> str:
+    """
+    Return the stripped string value of `field`, recording a DRF-style
+    error message in `errors` if it is missing, not a string or blank.
+    """
+    value = data.get(field)
+    if value is None:
+        errors[field] = ["This field is required."]
+    elif not isinstance(value, str):
+        errors[field] = ["Not a valid string."]
+    elif not value.strip():
+        errors[field] = ["This field may not be blank."]
+    else:
+        return value.strip()
+    return ""
+
+
+def _clean_email(data, errors: dict) -> str:
+    """
+    Like `_clean_str` for the `email` field, additionally checking the format.
+    """
+    email = _clean_str(data, "email", errors)
+    if email:
+        try:
+            _EMAIL_VALIDATOR(email)
+        except DjangoValidationError:
+            errors["email"] = ["Enter a valid email address."]
+    return email
+
+
+def _parse_login(data) -> tuple[str, str]:
+    """
+    Validate the login payload without a serializer.
+    Returns (email, password) or raises ValidationError with the same
+    error format a DRF serializer would produce.
+    """
+    if not isinstance(data, Mapping):
+        raise ValidationError({"non_field_errors": ["Invalid data. Expected a dictionary."]})
+
+    errors = {}
+    # No format check: an address that is not a valid email simply
+    # matches no user, so the lookup already rejects it.
+    email = _clean_str(data, "email", errors)
+    password = _clean_str(data, "password", errors)
+    if errors:
+        raise ValidationError(errors)
+    return email, password
+
+
+def _parse_email_query(query_params) -> str:
+    """
+    Validate the `email` query parameter of the email check endpoint.
+    """
+    errors = {}
+    email = _clean_email(query_params, errors)
+    if errors:
+        raise ValidationError(errors)
+    return email
 
 
 class RegistrationView(APIView):
@@ -22,17 +149,18 @@ class RegistrationView(APIView):
     """
 
     permission_classes = [permissions.AllowAny]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def post(self, request, format=None):
         serializer = RegistrationSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         user = serializer.save()
-        token, _ = Token.objects.get_or_create(user=user)
+        token = Token.objects.create(user=user)
 
         data = {
             "token": token.key,
-            "fullname": _get_fullname(user),
+            "fullname": _get_fullname_cached(request, user),
             "email": user.email,
             "user_id": user.id,
         }
@@ -46,20 +174,22 @@ class LoginView(APIView):
     Authenticates the user and returns token and basic user data.
     """
     permission_classes = [permissions.AllowAny]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def post(self, request, format=None):
         """
         Validate login credentials, authenticate user and return token payload.
         """
-        serializer = LoginSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        email = serializer.validated_data["email"]
-        password = serializer.validated_data["password"]
+        email, password = _parse_login(request.data)
 
         try:
-            user = User.objects.get(email__iexact=email)
+            user = (
+                User.objects.select_related("auth_token")
+                .only(*_USER_PAYLOAD_FIELDS, "password", "auth_token__key")
+                .get(email=email.lower())
+            )
         except User.DoesNotExist:
+            check_password(password, _dummy_password_hash())
             return Response(
                 {"detail": "Ungültige E-Mail oder Passwort."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -71,11 +201,9 @@ class LoginView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        token, _ = Token.objects.get_or_create(user=user)
-
         data = {
-            "token": token.key,
-            "fullname": _get_fullname(user),
+            "token": _get_token_key(user),
+            "fullname": _get_fullname_cached(request, user),
             "email": user.email,
             "user_id": user.id,
         }
@@ -88,30 +216,56 @@ class EmailCheckView(APIView):
     - GET /api/email-check/?email=...
     """
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    throttle_classes = [EmailCheckThrottle]
 
     def get(self, request, format=None):
         """
         Validate the email query parameter and return user info if found.
         """
-        serializer = EmailCheckSerializer(data=request.query_params)
-        serializer.is_valid(raise_exception=True)
+        email = _parse_email_query(request.query_params).lower()
 
-        email = serializer.validated_data["email"]
+        cache_key = email_check_cache_key(email)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._lookup(request, email)
+            cache.set(cache_key, data, EMAIL_CHECK_CACHE_TIMEOUT)
 
-        try:
-            user = User.objects.get(email__iexact=email)
-        except User.DoesNotExist:
+        if not data:
             return Response(
                 {"detail": "E-Mail nicht gefunden."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        data = {
+        etag = self._etag(data)
+        headers = {"ETag": etag}
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and _etag_matches(etag, if_none_match):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(data, status=status.HTTP_200_OK, headers=headers)
+
+    def _etag(self, data: dict) -> str:
+        """
+        Return a strong ETag for an email-check payload.
+        """
+        raw = f"{data['id']}:{data['email']}:{data['fullname']}"
+        return '"%s"' % hashlib.md5(raw.encode()).hexdigest()
+
+    def _lookup(self, request, email: str) -> dict:
+        """
+        Return the response payload for `email`, or an empty dict if no
+        user has this address (cached as well, to absorb repeated misses).
+        """
+        try:
+            user = User.objects.only(*_USER_PAYLOAD_FIELDS).get(email=email)
+        except User.DoesNotExist:
+            return {}
+
+        return {
             "id": user.id,
             "email": user.email,
-            "fullname": _get_fullname(user),
+            "fullname": _get_fullname_cached(request, user),
         }
-        return Response(data, status=status.HTTP_200_OK)
 
 
 
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.8 on 2026-10-15 09:12
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+# Vendors that support unique indexes on an expression with a WHERE clause.
+_PARTIAL_EXPRESSION_INDEX_VENDORS = ("postgresql", "sqlite")
+
+
+def check_case_duplicates(apps, schema_editor):
+    """
+    Abort before creating the index if emails that differ only in case
+    exist; those accounts have to be merged or changed by hand first.
+    """
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    duplicates = (
+        User.objects.exclude(email="")
+        .annotate(email_lower=Lower("email"))
+        .values("email_lower")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values_list("email_lower", flat=True)
+    )
+    conflicts = []
+    for email in duplicates:
+        ids = User.objects.filter(email__iexact=email).order_by("id").values_list("id", flat=True)
+        conflicts.append(f"{email}: {', '.join(str(pk) for pk in ids)}")
+    if conflicts:
+        raise RuntimeError(
+            "E-Mail-Adressen, die sich nur in der Groß-/Kleinschreibung "
+            "unterscheiden, müssen vor dieser Migration bereinigt werden "
+            "(E-Mail: Benutzer-IDs):\n" + "\n".join(conflicts)
+        )
+
+
+def create_email_index(apps, schema_editor):
+    if schema_editor.connection.vendor in _PARTIAL_EXPRESSION_INDEX_VENDORS:
+        schema_editor.execute(
+            "CREATE UNIQUE INDEX auth_user_email_ci_uniq ON auth_user (LOWER(email)) WHERE email <> '';"
+        )
+
+
+def drop_email_index(apps, schema_editor):
+    if schema_editor.connection.vendor in _PARTIAL_EXPRESSION_INDEX_VENDORS:
+        schema_editor.execute("DROP INDEX auth_user_email_ci_uniq;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_duplicates, migrations.RunPython.noop),
+        # auth.User belongs to django.contrib.auth, so the case-insensitive
+        # unique index is created with raw SQL. Users without an email
+        # (e.g. superusers) are excluded. Other vendors rely on the
+        # duplicate check in RegistrationSerializer.
+        migrations.RunPython(create_email_index, drop_email_index),
+    ]
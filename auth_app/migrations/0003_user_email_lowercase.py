@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-15 10:02
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    User.objects.exclude(email="").update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0002_user_email_ci_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        # Emails are stored lowercased from now on, so an index on the
+        # column itself serves the `email = %s` lookups.
+        migrations.RunSQL(
+            sql="CREATE INDEX auth_user_email_idx ON auth_user (email);",
+            reverse_sql="DROP INDEX auth_user_email_idx;",
+        ),
+    ]
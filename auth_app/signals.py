@@ -0,0 +1,50 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from .api.cache_keys import email_check_cache_key
+
+
+@receiver(post_init, sender=User)
+def remember_loaded_email(sender, instance, **kwargs):
+    """
+    Remember the email a user was loaded with (absent if deferred), so
+    saves can tell whether it changed without querying it again.
+    """
+    instance._loaded_email = instance.__dict__.get("email")
+
+
+@receiver(pre_save, sender=User)
+def normalize_user_email(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Store emails lowercased so lookups can use a plain `email = %s`
+    comparison (and its index) instead of a case-insensitive scan.
+    Also remembers a changed previous email, so its email-check entry
+    can be dropped after the save.
+    """
+    instance._previous_email = None
+    if raw:
+        return
+    if instance.email:
+        instance.email = instance.email.strip().lower()
+    if instance.pk is None or (update_fields is not None and "email" not in update_fields):
+        return
+
+    loaded_email = getattr(instance, "_loaded_email", None)
+    if loaded_email is None or instance._state.adding:
+        loaded_email = User.objects.filter(pk=instance.pk).values_list("email", flat=True).first()
+    if loaded_email != instance.email:
+        instance._previous_email = loaded_email
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_email_check_cache(sender, instance, **kwargs):
+    """
+    Drop the cached email-check payload when a user is created, changed
+    or deleted, for the previous address as well as the current one.
+    """
+    instance._loaded_email = instance.email
+    emails = {instance.email, getattr(instance, "_previous_email", None)}
+    cache.delete_many([email_check_cache_key(email) for email in emails if email])
@@ -1,3 +1,51 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+
+class EmailCheckCacheTests(APITestCase):
+    """
+    GET /api/email-check/ caches its payload; user writes must drop it.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("anna", "anna@example.com", "pw")
+        self.client.force_authenticate(self.user)
+
+    def check_email(self, email):
+        return self.client.get(reverse("api-email-check"), {"email": email})
+
+    def test_email_change_drops_old_and_new_entry(self):
+        self.assertEqual(self.check_email("anna@example.com").status_code, status.HTTP_200_OK)
+        self.assertEqual(self.check_email("neu@example.com").status_code, status.HTTP_404_NOT_FOUND)
+
+        user = User.objects.get(pk=self.user.pk)
+        user.email = "Neu@Example.com"
+        user.save()
+
+        self.assertEqual(self.check_email("anna@example.com").status_code, status.HTTP_404_NOT_FOUND)
+        response = self.check_email("neu@example.com")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], self.user.pk)
+
+    def test_delete_drops_entry(self):
+        self.assertEqual(self.check_email("anna@example.com").status_code, status.HTTP_200_OK)
+
+        self.user.delete()
+
+        self.client.force_authenticate(User.objects.create_user("ben", "ben@example.com", "pw"))
+        self.assertEqual(self.check_email("anna@example.com").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_save_of_loaded_user_does_not_reread_email(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.first_name = "Anna"
+
+        with CaptureQueriesContext(connection) as queries:
+            user.save()
+
+        self.assertEqual(len(queries.captured_queries), 1)
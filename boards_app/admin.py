@@ -7,4 +7,4 @@ from .models import Board, Task, Column, Activity
 admin.site.register(Board)
 admin.site.register(Task)
 admin.site.register(Column)
-admin.site.register(Activity)
\ No newline at end of file
+admin.site.register(Activity)
@@ -0,0 +1,96 @@
+import hashlib
+from functools import partial
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+PAGE_COUNT_CACHE_TIMEOUT = 60
+
+
+def page_count_cache_key(queryset) -> str:
+    """
+    Cache key for the row count of a queryset, derived from its SQL.
+    The SQL includes the filter values (e.g. the user id), so every
+    user and filter combination gets its own entry.
+    """
+    return "page-count:" + hashlib.md5(str(queryset.query).encode()).hexdigest()
+
+
+class CountQuerysetPaginator(Paginator):
+    """
+    Paginator that can count a separate queryset.
+    The list querysets carry several Count() annotations; counting them
+    directly wraps the whole GROUP BY in a subquery. Views can hand in
+    an annotation-free queryset with the same rows instead.
+    The count is cached briefly, so paging through a list runs COUNT(*)
+    once instead of once per page.
+    """
+
+    def __init__(self, object_list, per_page, count_queryset=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_queryset = count_queryset
+
+    _count_from_cache = False
+
+    @cached_property
+    def count(self):
+        queryset = self._get_count_queryset()
+        if not hasattr(queryset, "query"):
+            return super().count
+        try:
+            key = page_count_cache_key(queryset)
+        except EmptyResultSet:
+            return 0
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, PAGE_COUNT_CACHE_TIMEOUT)
+        else:
+            self._count_from_cache = True
+        return count
+
+    def _get_count_queryset(self):
+        if self.count_queryset is None:
+            return self.object_list
+        return self.count_queryset
+
+    def validate_number(self, number):
+        """
+        A page past the end of a cached count may exist by now; recount
+        once with COUNT(*) before reporting the page as missing.
+        """
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self._count_from_cache:
+                raise
+        queryset = self._get_count_queryset()
+        count = queryset.count()
+        cache.set(page_count_cache_key(queryset), count, PAGE_COUNT_CACHE_TIMEOUT)
+        self.__dict__["count"] = count
+        self.__dict__.pop("num_pages", None)
+        self._count_from_cache = False
+        return super().validate_number(number)
+
+
+class OptionalPageNumberPagination(PageNumberPagination):
+    """
+    Page number pagination that is only active when the client sends
+    `?page_size=`, so plain list responses keep their current format.
+    Uses `view.get_count_queryset()` for the total count if available.
+    """
+
+    page_size = None
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        get_count_queryset = getattr(view, "get_count_queryset", None)
+        count_queryset = get_count_queryset() if get_count_queryset else None
+        self.django_paginator_class = partial(
+            CountQuerysetPaginator, count_queryset=count_queryset
+        )
+        return super().paginate_queryset(queryset, request, view)
@@ -1,9 +1,75 @@
+from operator import attrgetter
+
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 from ..models import Board, Column, Task, Activity
 from rest_framework import permissions
 from django.shortcuts import get_object_or_404
 
 
+def member_board_ids(user):
+    """
+    Subquery of the ids of all boards the user is a member of.
+    Reads the members through table only, so filtering with
+    `board_id__in=` never multiplies rows and needs no DISTINCT.
+    """
+    return Board.members.through.objects.filter(user_id=user.id).values("board_id")
+
+
+def get_user_board_ids(request) -> frozenset:
+    """
+    Return the ids of all boards the current user owns or is a member of.
+    The set is queried once per request and cached on the request, so
+    object permission checks for many objects cost a single query.
+    """
+    board_ids = getattr(request, "_user_board_ids", None)
+    if board_ids is None:
+        user_id = request.user.id
+        owned = Board.objects.filter(owner_id=user_id).order_by().values_list("id", flat=True)
+        member_of = (
+            Board.members.through.objects.filter(user_id=user_id)
+            .order_by()
+            .values_list("board_id", flat=True)
+        )
+        board_ids = frozenset(owned.union(member_of))
+        request._user_board_ids = board_ids
+    return board_ids
+
+
+def is_board_member(request, board) -> bool:
+    """
+    Return True if the current user owns or is a member of `board`.
+    Uses the board id set if this request already loaded it, otherwise a
+    single EXISTS on the members through table, memoized per board.
+    """
+    user_id = request.user.id
+    if board.owner_id == user_id:
+        return True
+    board_ids = getattr(request, "_user_board_ids", None)
+    if board_ids is not None:
+        return board.id in board_ids
+    cache = request.__dict__.setdefault("_board_member_cache", {})
+    if board.id not in cache:
+        cache[board.id] = Board.members.through.objects.filter(
+            board_id=board.id, user_id=user_id
+        ).exists()
+    return cache[board.id]
+
+
+# Board id lookup for every object type guarded by IsBoardMember.
+_BOARD_ID_GETTERS = {
+    Board: attrgetter("id"),
+    Column: attrgetter("board_id"),
+    Task: attrgetter("board_id"),
+    Activity: attrgetter("task.board_id"),
+}
+
+# Board owner lookup for the object types that carry it without a query.
+_BOARD_OWNER_ID_GETTERS = {
+    Board: attrgetter("owner_id"),
+    Task: attrgetter("board_owner_id"),
+}
+
+
 class IsBoardMember(permissions.BasePermission):
     """
     Allow access only to authenticated users who are owner or member
@@ -19,27 +85,22 @@ class IsBoardMember(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         """
         Check if the user is owner or member of the related board.
+        The owner id is compared first, where available; the board id set
+        is only queried when that check fails.
         """
-       
-        if isinstance(obj, Board):
-            board = obj
-        elif isinstance(obj, Column):
-            board = obj.board
-        elif isinstance(obj, Task):
-            board = obj.board
-        elif isinstance(obj, Activity):
-            board = obj.task.board
-        else:
+        get_board_id = _BOARD_ID_GETTERS.get(type(obj))
+        if get_board_id is None:
             return False
 
         user = request.user
         if not user or not user.is_authenticated:
             return False
 
-        if board.owner_id == user.id:
+        get_owner_id = _BOARD_OWNER_ID_GETTERS.get(type(obj))
+        if get_owner_id is not None and get_owner_id(obj) == user.id:
             return True
 
-        return board.members.filter(id=user.id).exists()
+        return get_board_id(obj) in get_user_board_ids(request)
 
 
 class IsBoardOwnerForBoardDelete(BasePermission):
@@ -91,10 +152,10 @@ class IsAssigneeOrReviewerForTaskWrite(BasePermission):
             return False
 
         if request.method == "DELETE":
-            return obj.board.owner_id == user.id
+            return obj.board_owner_id == user.id
 
         return (
-            obj.board.owner_id == user.id
+            obj.board_owner_id == user.id
             or obj.assignee_id == user.id
             or obj.reviewer_id == user.id
         )
@@ -114,7 +175,7 @@ class IsTaskCreatorOrBoardOwner(permissions.BasePermission):
         if not user or not user.is_authenticated:
             return False
 
-        if obj.board.owner_id == user.id:
+        if obj.board_owner_id == user.id:
             return True
 
         if obj.created_by_id == user.id:
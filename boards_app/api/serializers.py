@@ -1,42 +1,94 @@
-from boards_app.models import Board, Column, Task
-from rest_framework import serializers
+import copy
+
 from django.contrib.auth.models import User
-from boards_app.models import Board, Column, Task, Activity
+from django.db.models import Case, CharField, Value, When
+from django.db.models.functions import Lower
+from rest_framework import serializers
 from rest_framework.exceptions import NotFound
 
+from boards_app.models import Board, Column, Task, Activity
+from core.utils import format_display_name
+
+# API labels for column status and task priority, plus their inverses.
+_COLUMN_STATUS_TO_LABEL = {
+    Column.Status.TODO: "to-do",
+    Column.Status.IN_PROGRESS: "in-progress",
+    Column.Status.REVIEW: "review",
+    Column.Status.DONE: "done",
+}
+_LABEL_TO_COLUMN_STATUS = {label: value for value, label in _COLUMN_STATUS_TO_LABEL.items()}
+
+_PRIORITY_TO_LABEL = {
+    Task.Priority.LOW: "low",
+    Task.Priority.MEDIUM: "medium",
+    Task.Priority.HIGH: "high",
+    Task.Priority.CRITICAL: "critical",
+}
+_LABEL_TO_PRIORITY = {label: value for value, label in _PRIORITY_TO_LABEL.items()}
+
+
+def task_label_annotations():
+    """
+    Annotations that compute the API status and priority labels of a task
+    in SQL. TaskReadSerializer prefers them over its Python lookups.
+    """
+    return {
+        "_status_label": Case(
+            *[
+                When(status=value, then=Value(label))
+                for value, label in _COLUMN_STATUS_TO_LABEL.items()
+            ],
+            default=Value(""),
+            output_field=CharField(),
+        ),
+        "_priority_label": Lower("priority"),
+    }
+
+
+def _display_name(user):
+    """
+    "First Last" of a user, or the username if both are empty.
+    Cached on the instance, since the same user is usually rendered
+    many times per response (owner, members, assignees, authors).
+    """
+    try:
+        return user._display_name
+    except AttributeError:
+        name = format_display_name(user.first_name, user.last_name, user.username)
+        user._display_name = name
+        return name
+
 
-class UserSerializer(serializers.ModelSerializer):
+def _user_summary(user):
     """
-    Basic user serializer used in board and task APIs.
-    Exposes:
-    - primary key and username
-    - first/last name and email
-    - a computed `full_name` field
+    Plain-dict equivalent of UserSummarySerializer for embedded users,
+    skipping the per-object serializer instantiation and field loop.
     """
+    if user is None:
+        return None
+    return {"id": user.pk, "email": user.email, "fullname": _display_name(user)}
 
-    full_name = serializers.SerializerMethodField()
 
-    class Meta:
-        model = User
-        fields = [
-            "id",
-            "username",
-            "first_name",
-            "last_name",
-            "email",
-            "full_name",
-        ]
+class CachedFieldsMixin:
+    """
+    Build the field map of a serializer class once and give every instance
+    a deep copy of it, instead of re-running ModelSerializer's model
+    introspection (build_field etc.) each time a serializer is created.
+    The cached fields are never bound; binding happens on the copies.
+    """
 
-    def get_full_name(self, obj):
-        """
-        Build a display name from first_name and last_name.
-        If both are empty, falls back to `username`.
-        """
-        full = (obj.first_name or "").strip() + " " + (obj.last_name or "").strip()
-        return full.strip() or obj.username
-    
+    _fields_cache = {}
 
-class BoardListSerializer(serializers.ModelSerializer):
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            CachedFieldsMixin._fields_cache[cls] = fields
+        return copy.deepcopy(fields)
+
+
+class BoardListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for board list and create responses.
     Used for:
@@ -44,7 +96,7 @@ class BoardListSerializer(serializers.ModelSerializer):
     - response of POST /api/boards/
     """
 
-    member_count = serializers.SerializerMethodField()
+    member_count = serializers.IntegerField(read_only=True)
     ticket_count = serializers.IntegerField(read_only=True)
     tasks_to_do_count = serializers.IntegerField(read_only=True)
     tasks_high_prio_count = serializers.IntegerField(read_only=True)
@@ -62,11 +114,8 @@ class BoardListSerializer(serializers.ModelSerializer):
             "owner_id",
         ]
 
-    def get_member_count(self, obj):
-        return obj.members.count()
 
-
-class UserSummarySerializer(serializers.ModelSerializer):
+class UserSummarySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Compact user representation used in task responses.
     Exposes:
@@ -82,23 +131,21 @@ class UserSummarySerializer(serializers.ModelSerializer):
         fields = ["id", "email", "fullname"]
 
     def get_fullname(self, obj):
-        name = (obj.first_name + " " + obj.last_name).strip()
-        return name or obj.username
+        return _display_name(obj)
 
 
-class TaskReadSerializer(serializers.ModelSerializer):
+class TaskReadSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Read serializer for tasks:
     - used in GET /api/tasks/
     - used in GET /api/tasks/{id}/
     - used in assigned-to-me/reviewing/board-detail
     """
-    board = serializers.IntegerField(source="board.id", read_only=True)
-    assignee = UserSummarySerializer(read_only=True)
-    reviewer = UserSummarySerializer(read_only=True)
+    board = serializers.IntegerField(source="board_id", read_only=True)
+    assignee = serializers.SerializerMethodField()
+    reviewer = serializers.SerializerMethodField()
     status = serializers.SerializerMethodField()
     priority = serializers.SerializerMethodField()
-    comments_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Task
@@ -115,44 +162,84 @@ class TaskReadSerializer(serializers.ModelSerializer):
             "comments_count",
         ]
 
-    def get_status(self, obj):
-        mapping = {
-            Column.Status.TODO: "to-do",
-            Column.Status.IN_PROGRESS: "in-progress",
-            Column.Status.REVIEW: "review",
-            Column.Status.DONE: "done",
-        }
-        column = getattr(obj, "column", None)
-        if not column:
-            return ""
-        return mapping.get(column.status, "").lower()
+    def get_assignee(self, obj):
+        return _user_summary(obj.assignee)
 
-    def get_priority(self, obj):
-        return obj.priority.lower() if obj.priority else None
+    def get_reviewer(self, obj):
+        return _user_summary(obj.reviewer)
 
+    def get_status(self, obj):
+        if hasattr(obj, "_status_label"):
+            return obj._status_label
+        return _COLUMN_STATUS_TO_LABEL.get(obj.status, "")
 
-class TaskInBoardSerializer(TaskReadSerializer):
+    def get_priority(self, obj):
+        if hasattr(obj, "_priority_label"):
+            return obj._priority_label
+        return _PRIORITY_TO_LABEL.get(obj.priority)
+
+
+_TASK_USER_VALUES = {
+    prefix: (
+        f"{prefix}_id",
+        f"{prefix}__email",
+        f"{prefix}__first_name",
+        f"{prefix}__last_name",
+        f"{prefix}__username",
+    )
+    for prefix in ("assignee", "reviewer")
+}
+
+# Columns needed by fast_serialize_tasks(). The queryset must carry
+# the task_label_annotations().
+TASK_VALUES_FIELDS = (
+    "id",
+    "board_id",
+    "title",
+    "description",
+    "_status_label",
+    "_priority_label",
+    *_TASK_USER_VALUES["assignee"],
+    *_TASK_USER_VALUES["reviewer"],
+    "due_date",
+    "comments_count",
+)
+
+
+def _row_user(row, prefix):
+    user_id, email, first_name, last_name, username = _TASK_USER_VALUES[prefix]
+    if row[user_id] is None:
+        return None
+    return {
+        "id": row[user_id],
+        "email": row[email],
+        "fullname": format_display_name(row[first_name], row[last_name], row[username]),
+    }
+
+
+def fast_serialize_tasks(rows):
     """
-    Task representation inside board detail responses.
-    Used for:
-    - GET /api/boards/{id}/ (tasks array)
+    Build TaskReadSerializer output straight from `values(*TASK_VALUES_FIELDS)`
+    rows, without instantiating serializers or model objects.
     """
-
-    class Meta(TaskReadSerializer.Meta):
-        fields = [
-            "id",
-            "title",
-            "description",
-            "status",
-            "priority",
-            "assignee",
-            "reviewer",
-            "due_date",
-            "comments_count",
-        ]
+    return [
+        {
+            "id": row["id"],
+            "board": row["board_id"],
+            "title": row["title"],
+            "description": row["description"],
+            "status": row["_status_label"],
+            "priority": row["_priority_label"],
+            "assignee": _row_user(row, "assignee"),
+            "reviewer": _row_user(row, "reviewer"),
+            "due_date": row["due_date"].isoformat() if row["due_date"] else None,
+            "comments_count": row["comments_count"],
+        }
+        for row in rows
+    ]
 
 
-class BoardDetailSerializer(serializers.ModelSerializer):
+class BoardDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Detailed board representation used for GET /api/boards/{board_id}/.
     Includes:
@@ -161,16 +248,35 @@ class BoardDetailSerializer(serializers.ModelSerializer):
     - tasks: all tasks that belong to this board
     """
 
-    owner_id = serializers.IntegerField(source="owner.id", read_only=True)
-    members = UserSummarySerializer(many=True, read_only=True)
-    tasks = TaskInBoardSerializer(many=True, read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
+    members = serializers.SerializerMethodField()
+    tasks = serializers.SerializerMethodField()
 
     class Meta:
         model = Board
         fields = ["id", "title", "owner_id", "members", "tasks"]
 
+    def get_members(self, obj):
+        return [_user_summary(user) for user in obj.members.all()]
 
-class BoardUpdateSerializer(serializers.ModelSerializer):
+    def get_tasks(self, obj):
+        """
+        Tasks in kanban order, rendered from values() rows like the task
+        list; the board id is left out since it is the enclosing board.
+        """
+        rows = (
+            Task.objects.filter(board_id=obj.id)
+            .annotate(**task_label_annotations())
+            .order_by("column__position", "position", "id")
+            .values(*TASK_VALUES_FIELDS)
+        )
+        tasks = fast_serialize_tasks(rows)
+        for task in tasks:
+            del task["board"]
+        return tasks
+
+
+class BoardUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer used for updating a board (PATCH /api/boards/{id}/).
     Response format matches the API specification:
@@ -178,9 +284,8 @@ class BoardUpdateSerializer(serializers.ModelSerializer):
     - members_data: compact representation of all board members
     - members: list of member IDs (write-only)
     """
-    owner_data = UserSummarySerializer(source="owner", read_only=True)
-    members_data = UserSummarySerializer(
-        source="members", many=True, read_only=True)
+    owner_data = serializers.SerializerMethodField()
+    members_data = serializers.SerializerMethodField()
 
     class Meta:
         model = Board
@@ -189,6 +294,12 @@ class BoardUpdateSerializer(serializers.ModelSerializer):
             "members": {"write_only": True, "required": False},
         }
 
+    def get_owner_data(self, obj):
+        return _user_summary(obj.owner)
+
+    def get_members_data(self, obj):
+        return [_user_summary(user) for user in obj.members.all()]
+
 
 class ColumnSerializer(serializers.ModelSerializer):
     """
@@ -203,6 +314,130 @@ class ColumnSerializer(serializers.ModelSerializer):
         fields = ["id", "board", "name", "status", "position"]
 
 
+class PrefetchedPrimaryKeyField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that first looks the id up in an `{id: object}`
+    dict stored under `context[prefetch_key]`, if the root serializer put
+    one there; otherwise it queries like PrimaryKeyRelatedField.
+    """
+
+    prefetch_key = None
+
+    def __init__(self, prefetch_key=None, **kwargs):
+        if prefetch_key is not None:
+            self.prefetch_key = prefetch_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        objects = self.context.get(self.prefetch_key)
+        if objects is not None:
+            pk = _parse_pk(data)
+            if pk is not None:
+                if pk not in objects:
+                    self.fail("does_not_exist", pk_value=data)
+                return objects[pk]
+        return super().to_internal_value(data)
+
+
+def _parse_pk(data):
+    """
+    Integer id of a raw pk value, or None if it is not a plain integer.
+    """
+    if isinstance(data, bool):
+        return None
+    if isinstance(data, int):
+        return data
+    if isinstance(data, str) and data.isdigit():
+        return int(data)
+    return None
+
+
+class BoardPrimaryKeyField(PrefetchedPrimaryKeyField):
+    """
+    Board reference by id. An unknown id answers 404 instead of the
+    generic 400 of PrimaryKeyRelatedField.
+    """
+
+    prefetch_key = "_boards_by_id"
+
+    def to_internal_value(self, data):
+        try:
+            return super().to_internal_value(data)
+        except serializers.ValidationError as exc:
+            if exc.get_codes() == ["does_not_exist"]:
+                raise NotFound("Das angegebene Board existiert nicht.")
+            raise
+
+
+class TaskWriteListSerializer(serializers.ListSerializer):
+    """
+    Create several tasks with a single bulk INSERT.
+    Used by POST /api/tasks/bulk/.
+    Boards, users and columns referenced by the items are loaded with one
+    query each before the items are validated.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list) and (
+            self.max_length is None or len(data) <= self.max_length
+        ):
+            self._prefetch_references(data)
+
+        return super().to_internal_value(data)
+
+    def _prefetch_references(self, data):
+        board_ids, user_ids = set(), set()
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            board_ids.add(_parse_pk(item.get("board")))
+            user_ids.add(_parse_pk(item.get("assignee_id")))
+            user_ids.add(_parse_pk(item.get("reviewer_id")))
+        board_ids.discard(None)
+        user_ids.discard(None)
+
+        self.context["_boards_by_id"] = Board.objects.only("id", "owner").in_bulk(board_ids)
+        self.context["_users_by_id"] = User.objects.in_bulk(user_ids)
+
+        columns_by_board = self.context.setdefault("_columns_by_board", {})
+        for board_id in board_ids:
+            columns_by_board.setdefault(board_id, {})
+        for column in Column.objects.filter(board_id__in=board_ids):
+            columns_by_board[column.board_id].setdefault(column.status, column)
+
+    def create(self, validated_data):
+        """
+        Resolve every item first, so a missing column is reported at the
+        index of the item it belongs to.
+        """
+        tasks, errors = [], []
+        for attrs in validated_data:
+            try:
+                tasks.append(Task(**self.child.prepare_create(attrs)))
+            except serializers.ValidationError as exc:
+                errors.append(exc.detail)
+            else:
+                errors.append({})
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        for task in tasks:
+            task.sync_denormalized_fields()
+        return Task.objects.bulk_create(tasks, batch_size=1000)
+
+
+class PriorityLabelField(serializers.ChoiceField):
+    """
+    Choice field for priority labels that also accepts other spellings
+    of a label (e.g. "High"); the lowercase label is returned.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) and data not in self.choice_strings_to_values:
+            data = data.lower()
+        return super().to_internal_value(data)
+
+
 class TaskWriteSerializer(serializers.ModelSerializer):
     """
     Write serializer for /api/tasks/ (POST, PATCH).
@@ -213,18 +448,37 @@ class TaskWriteSerializer(serializers.ModelSerializer):
     - priority: "low" | "medium" | "high" | "critical"
     """
 
-    board = serializers.IntegerField(write_only=True)
-    status = serializers.CharField(write_only=True, required=False)
-    priority = serializers.CharField(write_only=True, required=False)
+    board = BoardPrimaryKeyField(
+        queryset=Board.objects.only("id", "owner"),
+        write_only=True,
+    )
+    status = serializers.ChoiceField(
+        choices=list(_LABEL_TO_COLUMN_STATUS),
+        write_only=True,
+        error_messages={
+            "required": "Dieses Feld ist erforderlich.",
+            "invalid_choice": "Ungültiger Status. Erlaubt: to-do, in-progress, review, done.",
+        },
+    )
+    priority = PriorityLabelField(
+        choices=list(_LABEL_TO_PRIORITY),
+        write_only=True,
+        error_messages={
+            "required": "Dieses Feld ist erforderlich.",
+            "invalid_choice": "Ungültige Priorität. Erlaubt: low, medium, high, critical.",
+        },
+    )
 
-    assignee_id = serializers.PrimaryKeyRelatedField(
+    assignee_id = PrefetchedPrimaryKeyField(
+        prefetch_key="_users_by_id",
         source="assignee",
         queryset=User.objects.all(),
         required=False,
         allow_null=True,
         write_only=True,
     )
-    reviewer_id = serializers.PrimaryKeyRelatedField(
+    reviewer_id = PrefetchedPrimaryKeyField(
+        prefetch_key="_users_by_id",
         source="reviewer",
         queryset=User.objects.all(),
         required=False,
@@ -246,78 +500,36 @@ class TaskWriteSerializer(serializers.ModelSerializer):
             "due_date",
         ]
         read_only_fields = ["id"]
-
-    def validate_board(self, value: int) -> Board:
-        """
-        Resolve integer board id to a Board instance.
-        """
-        try:
-            return Board.objects.get(pk=value)
-        except Board.DoesNotExist:
-            raise NotFound("Das angegebene Board existiert nicht.")
+        list_serializer_class = TaskWriteListSerializer
 
     def _get_column_for_status(self, board: Board, status_label: str) -> Column:
         """
-        Map external status label to the matching Column of the board.
+        Map a (validated) status label to the matching Column of the board.
         """
-        label_to_choice = {
-            "to-do": "TODO",
-            "in-progress": "IN_PROGRESS",
-            "review": "REVIEW",
-            "done": "DONE",
-        }
         try:
-            choice_value = label_to_choice[status_label]
+            return self._get_board_columns(board)[_LABEL_TO_COLUMN_STATUS[status_label]]
         except KeyError:
-            raise serializers.ValidationError(
-                {"status": "Ungültiger Status. Erlaubt: to-do, in-progress, review, done."}
-            )
-
-        try:
-            return Column.objects.get(board=board, status=choice_value)
-        except Column.DoesNotExist:
             raise serializers.ValidationError(
                 {"status": "Für dieses Board existiert keine Spalte mit diesem Status."}
             )
 
-    def _map_priority_label(self, label: str) -> str:
+    def _get_board_columns(self, board: Board) -> dict:
         """
-        Map external priority label to Task.Priority value.
+        Return the board's columns keyed by status (first by position wins).
+        Loaded once per board and cached in the serializer context, so
+        repeated writes within a request reuse the same lookup.
         """
-        mapping = {
-            "low": Task.Priority.LOW,
-            "medium": Task.Priority.MEDIUM,
-            "high": Task.Priority.HIGH,
-            "critical": Task.Priority.CRITICAL,
-        }
-        try:
-            return mapping[label.lower()]
-        except KeyError:
-            raise serializers.ValidationError(
-                {"priority": "Ungültige Priorität. Erlaubt: low, medium, high, critical."}
-            )
-
-    def validate(self, attrs):
+        cache = self.context.setdefault("_columns_by_board", {})
+        if board.id not in cache:
+            columns = {}
+            for column in board.columns.all():
+                columns.setdefault(column.status, column)
+            cache[board.id] = columns
+        return cache[board.id]
+
+    def prepare_create(self, validated_data):
         """
-        For POST: status and priority are required.
-        For PATCH: both may be omitted.
-        """
-        request = self.context.get("request")
-        is_partial = getattr(request, "method", "").upper() == "PATCH"
-
-        if not is_partial:
-            if "status" not in attrs:
-                raise serializers.ValidationError(
-                    {"status": "Dieses Feld ist erforderlich."})
-            if "priority" not in attrs:
-                raise serializers.ValidationError(
-                    {"priority": "Dieses Feld ist erforderlich."})
-
-        return super().validate(attrs)
-
-    def create(self, validated_data):
-        """
-        Create task: resolve status → column and priority → enum.
+        Resolve status → column and priority → enum for a new task.
         """
         status_label = validated_data.pop("status")
         priority_label = validated_data.pop("priority")
@@ -325,9 +537,14 @@ class TaskWriteSerializer(serializers.ModelSerializer):
         board = validated_data["board"]
         validated_data["column"] = self._get_column_for_status(
             board, status_label)
-        validated_data["priority"] = self._map_priority_label(priority_label)
+        validated_data["priority"] = _LABEL_TO_PRIORITY[priority_label]
+        return validated_data
 
-        return super().create(validated_data)
+    def create(self, validated_data):
+        """
+        Create task with status and priority resolved.
+        """
+        return super().create(self.prepare_create(validated_data))
 
     def update(self, instance, validated_data):
         """
@@ -342,13 +559,16 @@ class TaskWriteSerializer(serializers.ModelSerializer):
 
         if "priority" in validated_data:
             priority_label = validated_data.pop("priority")
-            validated_data["priority"] = self._map_priority_label(
-                priority_label)
+            validated_data["priority"] = _LABEL_TO_PRIORITY[priority_label]
 
         return super().update(instance, validated_data)
 
 
-class CommentSerializer(serializers.ModelSerializer):
+# Unbound field used to format timestamps exactly like DRF's DateTimeField.
+_DATETIME_FIELD = serializers.DateTimeField()
+
+
+class CommentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     - GET /api/tasks/{task_id}/comments/
     - POST /api/tasks/{task_id}/comments/
@@ -364,11 +584,57 @@ class CommentSerializer(serializers.ModelSerializer):
     def get_author(self, obj):
         if obj.author is None:
             return "Unknown"
-        name = (obj.author.first_name + " " + obj.author.last_name).strip()
-        return name or obj.author.username
+        return _display_name(obj.author)
+
+    def to_representation(self, instance):
+        """
+        Build the output dict directly instead of looping over the bound
+        fields; comment lists are rendered often and have a fixed shape.
+        """
+        return {
+            "id": instance.id,
+            "created_at": _DATETIME_FIELD.to_representation(instance.created_at),
+            "author": self.get_author(instance),
+            "content": instance.message,
+        }
+
+
+COMMENT_VALUES_FIELDS = (
+    "id",
+    "created_at",
+    "message",
+    "author_id",
+    "author__first_name",
+    "author__last_name",
+    "author__username",
+)
+
+
+def _row_author(row):
+    if row["author_id"] is None:
+        return "Unknown"
+    return format_display_name(
+        row["author__first_name"], row["author__last_name"], row["author__username"]
+    )
+
+def fast_serialize_comments(rows):
+    """
+    Build CommentSerializer output straight from
+    `values(*COMMENT_VALUES_FIELDS)` rows.
+    """
+    return [
+        {
+            "id": row["id"],
+            "created_at": _DATETIME_FIELD.to_representation(row["created_at"]),
+            "author": _row_author(row),
+            "content": row["message"],
+        }
+        for row in rows
+    ]
+
 
 
-class ActivitySerializer(serializers.ModelSerializer):
+class ActivitySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for task activities/comments.
     Used for:
@@ -376,7 +642,7 @@ class ActivitySerializer(serializers.ModelSerializer):
     - creating new comments
     """
 
-    author = UserSerializer(read_only=True)
+    author = UserSummarySerializer(read_only=True)
 
     class Meta:
         model = Activity
@@ -17,13 +17,13 @@ router.register("boards", BoardViewSet, basename="board")
 router.register("tasks", TaskViewSet, basename="task")
 router.register("columns", ColumnViewSet, basename="column")
 
+# Only the two task lists whose paths would otherwise be captured by the
+# router's tasks/{pk}/ route go before it; everything else comes after.
 urlpatterns = [
-  
     path("tasks/assigned-to-me/", AssignedToMeTasksView.as_view(), name="tasks-assigned-to-me"),
     path("tasks/reviewing/", ReviewingTasksView.as_view(), name="tasks-reviewing"),
+    path("", include(router.urls)),
     path("tasks/<int:task_id>/comments/", TaskCommentsListCreateView.as_view(), name="task-comments"),
     path("tasks/<int:task_id>/comments/<int:comment_id>/", TaskCommentDeleteView.as_view(), name="task-comment-delete"),
     path("dashboard/stats/", DashboardStatsView.as_view(), name="dashboard-stats"),
-    path("", include(router.urls)),
 ]
-
@@ -1,11 +1,16 @@
 from datetime import timedelta
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import viewsets, permissions, status, generics
+from rest_framework.decorators import action
+from rest_framework.filters import OrderingFilter
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.renderers import BrowsableAPIRenderer
+from core.renderers import ORJSONRenderer
 from boards_app.models import Board, Column, Task, Activity
 from .serializers import (
     BoardDetailSerializer,
@@ -16,16 +21,66 @@ from .serializers import (
     ActivitySerializer,
     BoardListSerializer,
     BoardUpdateSerializer,
-
+    task_label_annotations,
+    fast_serialize_tasks,
+    fast_serialize_comments,
+    TASK_VALUES_FIELDS,
+    COMMENT_VALUES_FIELDS,
 )
 from .permissions import (
+    get_user_board_ids,
+    is_board_member,
+    member_board_ids,
     IsBoardMember,
     IsBoardOwnerForBoardDelete,
     IsTaskCreatorOrBoardOwner
 )
 
 
-class BoardViewSet(viewsets.ModelViewSet):
+# Upper bound for the number of tasks in one POST /api/tasks/bulk/ request.
+BULK_CREATE_MAX_TASKS = 100
+
+# Author columns read by ActivitySerializer.
+_ACTIVITY_AUTHOR_FIELDS = (
+    "author__id",
+    "author__email",
+    "author__first_name",
+    "author__last_name",
+    "author__username",
+)
+
+
+class RequestCachedQuerysetMixin:
+    """
+    Build the view's queryset once per request in `build_queryset()` and
+    hand out the same (unevaluated) queryset on every get_queryset() call,
+    e.g. from get_object() and the list/pagination path.
+    """
+
+    def get_queryset(self):
+        if not hasattr(self, "_queryset"):
+            self._queryset = self.build_queryset()
+        return self._queryset
+
+
+class TaskValuesListMixin:
+    """
+    Render list responses from plain values() rows with fast_serialize_tasks,
+    which yields the same payload as TaskReadSerializer without per-task
+    serializers. The queryset must carry task_label_annotations().
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*TASK_VALUES_FIELDS)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(fast_serialize_tasks(page))
+        return Response(fast_serialize_tasks(rows))
+
+
+class BoardViewSet(RequestCachedQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for board CRUD operations.
     Endpoints:
@@ -42,24 +97,56 @@ class BoardViewSet(viewsets.ModelViewSet):
         IsBoardOwnerForBoardDelete,
     ]
 
-    def get_queryset(self):
+    def build_queryset(self):
         """
         Return boards visible to the current user.
         - list: only boards where the user is owner or member
         - detail: all boards, object permissions handle 403 vs 404
+        Related rows are loaded per action, only where the serializer
+        of that action reads them.
         """
         if self.action == "list":
             user = self.request.user
-            return Board.objects.filter(
-                Q(owner=user) | Q(members=user)
-            ).distinct()
+            return Board.objects.annotate(
+                _member_count=Count("members", distinct=True),
+                _ticket_count=Count("tasks", distinct=True),
+                _tasks_to_do_count=Count(
+                    "tasks",
+                    filter=Q(tasks__status=Column.Status.TODO),
+                    distinct=True,
+                ),
+                _tasks_high_prio_count=Count(
+                    "tasks",
+                    filter=Q(tasks__priority=Task.Priority.HIGH),
+                    distinct=True,
+                ),
+            ).filter(
+                Q(owner=user) | Q(id__in=member_board_ids(user))
+            ).order_by("title")
+        if self.action == "retrieve":
+            # Tasks are read as values() rows by BoardDetailSerializer.
+            return Board.objects.prefetch_related("members")
+        if self.action in ("update", "partial_update"):
+            # owner_data is rendered from the joined owner. Members are not
+            # prefetched: DRF drops prefetch caches after saving anyway.
+            return Board.objects.select_related("owner")
         return Board.objects.all()
 
+    def get_count_queryset(self):
+        """
+        Rows of the list action without the count annotations,
+        used by the paginator for the total count.
+        """
+        user = self.request.user
+        return Board.objects.filter(
+            Q(owner=user) | Q(id__in=member_board_ids(user))
+        )
+
     def get_object(self):
         """
         Return a single board instance and enforce object-level permissions.
         """
-        obj = get_object_or_404(Board, pk=self.kwargs["pk"])
+        obj = get_object_or_404(self.get_queryset(), pk=self.kwargs["pk"])
         self.check_object_permissions(self.request, obj)
         return obj
 
@@ -79,8 +166,6 @@ class BoardViewSet(viewsets.ModelViewSet):
         and create default columns for the board.
         """
         user = self.request.user
-        board = serializer.save(owner=user)
-        board.members.add(user)
 
         default_columns = [
             ("To-do",       Column.Status.TODO,        1),
@@ -89,16 +174,28 @@ class BoardViewSet(viewsets.ModelViewSet):
             ("Done",        Column.Status.DONE,        4),
         ]
 
-        for name, status, position in default_columns:
-            Column.objects.create(
-                board=board,
-                name=name,
-                status=status,
-                position=position,
+        with transaction.atomic():
+            board = serializer.save(owner=user)
+            # Insert the membership row directly: the board is new, so the
+            # existence check and m2m_changed signals of add() are not needed.
+            Board.members.through.objects.bulk_create(
+                [Board.members.through(board_id=board.id, user_id=user.id)],
+                ignore_conflicts=True,
+            )
+            Column.objects.bulk_create(
+                Column(board=board, name=name, status=status, position=position)
+                for name, status, position in default_columns
             )
 
+        # The new board has only its owner as member and no tasks yet, so
+        # the response counters are known without counting.
+        board._member_count = 1
+        board._ticket_count = 0
+        board._tasks_to_do_count = 0
+        board._tasks_high_prio_count = 0
 
-class ColumnViewSet(viewsets.ModelViewSet):
+
+class ColumnViewSet(RequestCachedQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for CRUD operations on board columns.
     """
@@ -106,17 +203,19 @@ class ColumnViewSet(viewsets.ModelViewSet):
     serializer_class = ColumnSerializer
     permission_classes = [permissions.IsAuthenticated, IsBoardMember]
 
-    def get_queryset(self):
+    def build_queryset(self):
         """
         Return columns for boards where the user is owner or member.
         """
         user = self.request.user
         return Column.objects.filter(
-            Q(board__owner=user) | Q(board__members=user)
-        ).distinct()
+            Q(board__owner=user) | Q(board_id__in=member_board_ids(user))
+        )
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(
+    TaskValuesListMixin, RequestCachedQuerysetMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for task CRUD operations.
     Endpoints:
@@ -133,24 +232,40 @@ class TaskViewSet(viewsets.ModelViewSet):
         IsTaskCreatorOrBoardOwner,
     ]
 
-    def get_queryset(self):
+    def build_queryset(self):
         """
         Return tasks visible to the current user.
         * For list: only tasks on boards where the user is owner or member.
         * For detail: all tasks, permission is enforced via object permissions.
+        Related rows used by serializers and permissions are joined upfront.
         """
+        queryset = Task.objects.select_related(
+            "board", "column", "assignee", "reviewer"
+        )
+        if self.action in ("list", "retrieve"):
+            queryset = queryset.annotate(**task_label_annotations())
         if self.action == "list":
             user = self.request.user
-            return Task.objects.filter(
-                Q(board__owner=user) | Q(board__members=user)
-            ).distinct()
-        return Task.objects.all()
+            return queryset.filter(
+                Q(board_owner_id=user.id) | Q(board_id__in=member_board_ids(user))
+            ).order_by("column__position", "position", "id")
+        return queryset
+
+    def get_count_queryset(self):
+        """
+        Rows of the list action without the comment count annotation,
+        used by the paginator for the total count.
+        """
+        user = self.request.user
+        return Task.objects.filter(
+            Q(board_owner_id=user.id) | Q(board_id__in=member_board_ids(user))
+        )
 
     def get_object(self):
         """
         Return a single task instance and enforce object-level permissions.
         """
-        obj = get_object_or_404(Task, pk=self.kwargs["pk"])
+        obj = get_object_or_404(self.get_queryset(), pk=self.kwargs["pk"])
         self.check_object_permissions(self.request, obj)
         return obj
 
@@ -167,12 +282,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         Ensure current user is owner or member of the given board.
         :raises PermissionDenied: if the user is not allowed to create a task on this board.
         """
-        user = self.request.user
-
-        if board.owner_id == user.id:
-            return
-
-        if board.members.filter(id=user.id).exists():
+        if is_board_member(self.request, board):
             return
 
         raise PermissionDenied(
@@ -212,6 +322,39 @@ class TaskViewSet(viewsets.ModelViewSet):
             headers=headers,
         )
 
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """
+        Handle POST /api/tasks/bulk/ with a list of tasks.
+        The user must be member of every referenced board; all tasks are
+        inserted with one bulk INSERT and returned like single creates.
+        At most BULK_CREATE_MAX_TASKS tasks are accepted per request.
+        """
+        write_serializer = TaskWriteSerializer(
+            data=request.data,
+            many=True,
+            max_length=BULK_CREATE_MAX_TASKS,
+            allow_empty=False,
+            context=self.get_serializer_context(),
+        )
+        write_serializer.is_valid(raise_exception=True)
+
+        board_ids = get_user_board_ids(request)
+        for attrs in write_serializer.validated_data:
+            if attrs["board"].id not in board_ids:
+                raise PermissionDenied(
+                    "Der Benutzer muss Mitglied des Boards sein, um eine Task zu erstellen."
+                )
+
+        tasks = write_serializer.save(created_by=request.user)
+
+        read_serializer = TaskReadSerializer(
+            tasks,
+            many=True,
+            context=self.get_serializer_context(),
+        )
+        return Response(read_serializer.data, status=status.HTTP_201_CREATED)
+
     def update(self, request, *args, **kwargs):
         """
         Handle PUT/PATCH /api/tasks/{id}/.
@@ -244,19 +387,30 @@ class TaskViewSet(viewsets.ModelViewSet):
         return Response(data)
 
 
-class ActivityViewSet(viewsets.ModelViewSet):
+class ActivityViewSet(RequestCachedQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for CRUD operations on task activities/comments.
     """
     serializer_class = ActivitySerializer
     permission_classes = [permissions.IsAuthenticated, IsBoardMember]
 
-    def get_queryset(self):
+    def build_queryset(self):
         """
         Return activities for boards where the current user is a member.
         """
         user = self.request.user
-        return Activity.objects.filter(task__board__members=user).distinct()
+        return (
+            Activity.objects.filter(task__board_id__in=member_board_ids(user))
+            .select_related("task", "author")
+            .only(
+                "id",
+                "message",
+                "created_at",
+                "task__id",
+                "task__board_id",
+                *_ACTIVITY_AUTHOR_FIELDS,
+            )
+        )
 
 
 class DashboardStatsView(APIView):
@@ -266,81 +420,86 @@ class DashboardStatsView(APIView):
 
     permission_classes = [permissions.IsAuthenticated]
 
-    def _get_boards_count(self, user):
-        """
-        Return number of boards where the user is a member.
-        """
-        return Board.objects.filter(members=user).distinct().count()
-
-    def _get_my_tasks_qs(self, user):
-        """
-        Return tasks assigned to the user on boards they are a member of.
-        """
-        return Task.objects.filter(
-            assignee=user,
-            board__members=user,
-        ).distinct()
-
-    def _get_urgent_tasks_count(self, tasks_qs):
-        """
-        Return count of urgent to-do tasks (high/critical, due in 7 days).
-        """
-        today = timezone.now().date()
-        upcoming = today + timedelta(days=7)
-        return tasks_qs.filter(
-            column__status=Column.Status.TODO,
-            priority__in=[Task.Priority.HIGH, Task.Priority.CRITICAL],
-            due_date__range=(today, upcoming),
-        ).count()
-
-    def _get_done_recent_count(self, tasks_qs):
-        """
-        Return count of tasks done in the last 14 days.
-        """
-        two_weeks_ago = timezone.now() - timedelta(days=14)
-        return tasks_qs.filter(
-            column__status=Column.Status.DONE,
-            completed_at__gte=two_weeks_ago,
-        ).count()
-
     def get(self, request, format=None):
         """
-        Handle GET /api/dashboard-stats/ and return user statistics.
+        Handle GET /api/dashboard-stats/ and return user statistics:
+        - boards the user is a member of
+        - tasks assigned to the user on those boards, of which
+          urgent: high/critical to-do tasks due within 7 days
+          done recently: moved to done within the last 14 days
+        The task counters come from a single aggregate query.
         """
         user = request.user
-        my_tasks_qs = self._get_my_tasks_qs(user)
+        now = timezone.now()
+        today = now.date()
+        upcoming = today + timedelta(days=7)
+        two_weeks_ago = now - timedelta(days=14)
+
+        task_stats = Task.objects.filter(
+            assignee=user,
+            board_id__in=member_board_ids(user),
+        ).aggregate(
+            total=Count("id"),
+            urgent=Count(
+                "id",
+                filter=Q(
+                    status=Column.Status.TODO,
+                    priority__in=[Task.Priority.HIGH, Task.Priority.CRITICAL],
+                    due_date__range=(today, upcoming),
+                ),
+            ),
+            done_recent=Count(
+                "id",
+                filter=Q(
+                    status=Column.Status.DONE,
+                    completed_at__gte=two_weeks_ago,
+                ),
+            ),
+        )
 
         data = {
-            "boards_member_of": self._get_boards_count(user),
-            "tasks_assigned_to_me": my_tasks_qs.count(),
-            "urgent_tasks_count": self._get_urgent_tasks_count(my_tasks_qs),
-            "done_last_14_days": self._get_done_recent_count(my_tasks_qs),
+            "boards_member_of": Board.members.through.objects.filter(
+                user_id=user.id
+            ).count(),
+            "tasks_assigned_to_me": task_stats["total"],
+            "urgent_tasks_count": task_stats["urgent"],
+            "done_last_14_days": task_stats["done_recent"],
         }
         return Response(data)
 
 
-class AssignedToMeTasksView(generics.ListAPIView):
+class AssignedToMeTasksView(TaskValuesListMixin, generics.ListAPIView):
     """
     List tasks where the current user is the assignee.
     """
     serializer_class = TaskReadSerializer
     permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [OrderingFilter]
+    ordering_fields = ["due_date", "id"]
+    ordering = ["due_date", "id"]
 
     def get_queryset(self):
         user = self.request.user
-        return Task.objects.filter(assignee=user).order_by("due_date", "id")
+        return Task.objects.filter(assignee=user).annotate(
+            **task_label_annotations()
+        )
 
 
-class ReviewingTasksView(generics.ListAPIView):
+class ReviewingTasksView(TaskValuesListMixin, generics.ListAPIView):
     """
     List tasks where the current user is the reviewer.
     """
     serializer_class = TaskReadSerializer
     permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [OrderingFilter]
+    ordering_fields = ["due_date", "id"]
+    ordering = ["due_date", "id"]
 
     def get_queryset(self):
         user = self.request.user
-        return Task.objects.filter(reviewer=user).order_by("due_date", "id")
+        return Task.objects.filter(reviewer=user).annotate(
+            **task_label_annotations()
+        )
 
 
 class TaskCommentsListCreateView(generics.ListCreateAPIView):
@@ -353,19 +512,22 @@ class TaskCommentsListCreateView(generics.ListCreateAPIView):
 
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def get_task(self):
         """
         Return the task for the given URL kwarg and enforce board membership.
+        Resolved once per request and cached on the view.
         """
+        if not hasattr(self, "_task"):
+            self._task = self._resolve_task()
+        return self._task
+
+    def _resolve_task(self):
         task_id = self.kwargs["task_id"]
-        task = get_object_or_404(Task, pk=task_id)
-        user = self.request.user
+        task = get_object_or_404(Task.objects.select_related("board"), pk=task_id)
 
-        if not (
-            task.board.owner_id == user.id
-            or task.board.members.filter(id=user.id).exists()
-        ):
+        if not is_board_member(self.request, task.board):
             raise PermissionDenied("Du bist kein Mitglied dieses Boards.")
 
         return task
@@ -377,6 +539,21 @@ class TaskCommentsListCreateView(generics.ListCreateAPIView):
         task = self.get_task()
         return Activity.objects.filter(task=task).order_by("created_at")
 
+    def list(self, request, *args, **kwargs):
+        """
+        Handle GET /api/tasks/{task_id}/comments/.
+        Renders plain values() rows with fast_serialize_comments, which
+        yields the same payload as CommentSerializer.
+        """
+        rows = self.filter_queryset(self.get_queryset()).values(
+            *COMMENT_VALUES_FIELDS
+        )
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(fast_serialize_comments(page))
+        return Response(fast_serialize_comments(rows))
+
     def perform_create(self, serializer):
         """
         Create a new comment for the current task and set the author.
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-15 07:02
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_board_owner_ids(apps, schema_editor):
+    Board = apps.get_model("boards_app", "Board")
+    Task = apps.get_model("boards_app", "Task")
+    Task.objects.update(
+        board_owner_id=Subquery(
+            Board.objects.filter(pk=OuterRef("board_id")).values("owner_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_task_created_by_alter_task_priority'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='board_owner_id',
+            field=models.PositiveIntegerField(blank=True, db_index=True, editable=False, help_text='Kopie von board.owner_id für Berechtigungsprüfungen ohne Join.', null=True),
+        ),
+        migrations.RunPython(copy_board_owner_ids, migrations.RunPython.noop),
+    ]
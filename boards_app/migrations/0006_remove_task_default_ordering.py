@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 07:17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0005_task_activity_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='task',
+            options={},
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-15 07:18
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_existing_comments(apps, schema_editor):
+    Activity = apps.get_model("boards_app", "Activity")
+    Task = apps.get_model("boards_app", "Task")
+    counts = (
+        Activity.objects.filter(task_id=OuterRef("pk"))
+        .order_by()
+        .values("task_id")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    Task.objects.update(comments_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0006_remove_task_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Anzahl der Kommentare, gepflegt über Signale auf Activity.'),
+        ),
+        migrations.RunPython(count_existing_comments, migrations.RunPython.noop),
+    ]
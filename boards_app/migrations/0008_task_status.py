@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-15 07:18
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def copy_column_status(apps, schema_editor):
+    Column = apps.get_model("boards_app", "Column")
+    Task = apps.get_model("boards_app", "Task")
+    status = Column.objects.filter(pk=OuterRef("column_id")).values("status")
+    Task.objects.update(status=Coalesce(Subquery(status), Value("")))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0007_task_comments_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='status',
+            field=models.CharField(blank=True, choices=[('TODO', 'To Do'), ('IN_PROGRESS', 'In Progress'), ('REVIEW', 'Review'), ('DONE', 'Done')], db_index=True, default='', editable=False, help_text='Kopie von column.status für Filter ohne Join; leer ohne Spalte.', max_length=20),
+        ),
+        migrations.RunPython(copy_column_status, migrations.RunPython.noop),
+    ]
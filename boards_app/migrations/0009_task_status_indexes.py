@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-15 07:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0008_task_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_board_col_prio_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_col_completed_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'status', 'priority'], name='task_board_status_prio_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', 'status', 'completed_at'], name='task_assignee_status_done_idx'),
+        ),
+    ]
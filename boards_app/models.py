@@ -1,6 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import User
 
+# Marks a snapshot field that was not loaded (deferred or new instance).
+_NOT_LOADED = object()
+
 
 class Board(models.Model):
 
@@ -15,20 +18,53 @@ class Board(models.Model):
     def __str__(self) -> str:
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_owner_id = instance.__dict__.get("owner_id", _NOT_LOADED)
+        return instance
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        update_fields = kwargs.get("update_fields")
+        # A deferred owner_id was neither loaded nor assigned, so unchanged.
+        owner_id = self.__dict__.get("owner_id", _NOT_LOADED)
+        owner_changed = (
+            owner_id is not _NOT_LOADED
+            and getattr(self, "_loaded_owner_id", _NOT_LOADED) != owner_id
+        ) or (update_fields is not None and "owner" in update_fields)
+        super().save(*args, **kwargs)
+        self._loaded_owner_id = self.__dict__.get("owner_id", _NOT_LOADED)
+        if not adding and owner_changed:
+            # Keep the denormalized Task.board_owner_id in sync.
+            self.tasks.exclude(board_owner_id=self.owner_id).update(board_owner_id=self.owner_id)
+
+    # The counters below prefer the matching `_<name>` annotation when the
+    # queryset provides it (see BoardViewSet.build_queryset).
+
     @property
     def member_count(self) -> int:
-        return self.members.count()
+        if hasattr(self, "_member_count"):
+            return self._member_count
+        # Count the through table directly, members.count() joins auth_user.
+        return Board.members.through.objects.filter(board_id=self.id).count()
 
     @property
     def ticket_count(self) -> int:
+        if hasattr(self, "_ticket_count"):
+            return self._ticket_count
         return self.tasks.count()
 
     @property
     def tasks_to_do_count(self) -> int:
-        return self.tasks.filter(column__status=Column.Status.TODO).count()
+        if hasattr(self, "_tasks_to_do_count"):
+            return self._tasks_to_do_count
+        return self.tasks.filter(status=Column.Status.TODO).count()
 
     @property
     def tasks_high_prio_count(self) -> int:
+        if hasattr(self, "_tasks_high_prio_count"):
+            return self._tasks_high_prio_count
         return self.tasks.filter(priority=Task.Priority.HIGH).count()
 
 
@@ -49,7 +85,29 @@ class Column(models.Model):
         ordering = ["position", "id"]
 
     def __str__(self) -> str:
-        return f"{self.board.title} - {self.name}"
+        # Ids only, so rendering a column never loads its board.
+        return f"Board #{self.board_id} - {self.name}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get("status", _NOT_LOADED)
+        return instance
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        update_fields = kwargs.get("update_fields")
+        # A deferred status was neither loaded nor assigned, so unchanged.
+        status = self.__dict__.get("status", _NOT_LOADED)
+        status_changed = (
+            status is not _NOT_LOADED
+            and getattr(self, "_loaded_status", _NOT_LOADED) != status
+        ) or (update_fields is not None and "status" in update_fields)
+        super().save(*args, **kwargs)
+        self._loaded_status = self.__dict__.get("status", _NOT_LOADED)
+        if not adding and status_changed:
+            # Keep the denormalized Task.status in sync.
+            self.tasks.exclude(status=self.status).update(status=self.status)
 
 
 class Task(models.Model):
@@ -73,19 +131,42 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, help_text="Erstellzeitpunkt der Task.")
     updated_at = models.DateTimeField(auto_now=True, help_text="Zeitpunkt der letzten Änderung.")
     completed_at = models.DateTimeField(null=True, blank=True, help_text="Zeitpunkt, an dem die Task als Done markiert wurde.")
+    board_owner_id = models.PositiveIntegerField(null=True, blank=True, editable=False, db_index=True, help_text="Kopie von board.owner_id für Berechtigungsprüfungen ohne Join.")
+    comments_count = models.PositiveIntegerField(default=0, editable=False, help_text="Anzahl der Kommentare, gepflegt über Signale auf Activity.")
+    status = models.CharField(max_length=20, choices=Column.Status.choices, blank=True, default="", editable=False, db_index=True, help_text="Kopie von column.status für Filter ohne Join; leer ohne Spalte.")
 
     class Meta:
-        ordering = ["column__position", "position", "id"]
-
-    @property
-    def status(self) -> str:
-        if not self.column:
-            return None
-        return self.column.status.label
-
-    @property
-    def comments_count(self) -> int:
-        return self.activities.count()
+        # No default ordering: it would join the column for every task
+        # query. Views that need the kanban order apply it explicitly.
+        indexes = [
+            models.Index(fields=["assignee", "due_date"], name="task_assignee_due_idx"),
+            models.Index(fields=["reviewer", "due_date"], name="task_reviewer_due_idx"),
+            models.Index(fields=["board", "status", "priority"], name="task_board_status_prio_idx"),
+            models.Index(fields=["assignee", "status", "completed_at"], name="task_assignee_status_done_idx"),
+        ]
+
+    def sync_denormalized_fields(self):
+        """
+        Copy board.owner_id and column.status onto the task. Called by
+        save() and by bulk creates, which bypass save().
+        """
+        self.board_owner_id = self.board.owner_id
+        self.status = self.column.status if self.column_id else ""
+
+    def save(self, *args, **kwargs):
+        self.sync_denormalized_fields()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "board_owner_id", "status"}
+        elif not self._state.adding:
+            # comments_count is only changed by atomic F() updates from the
+            # Activity signals; never write back a possibly stale value.
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "comments_count"
+            ]
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return self.title
@@ -100,7 +181,11 @@ class Activity(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["task", "created_at"], name="activity_task_created_idx"),
+        ]
 
     def __str__(self) -> str:
-        author_name = self.author.username if self.author else "Unknown"
-        return f"Activity by {author_name} on {self.task.title}"
+        # Ids only, so rendering an activity never loads author or task.
+        author = f"user #{self.author_id}" if self.author_id else "Unknown"
+        return f"Activity by {author} on task #{self.task_id}"
@@ -0,0 +1,40 @@
+from django.db.models import F, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Activity, Column, Task
+
+
+@receiver(post_save, sender=Activity)
+def increment_comments_count(sender, instance, created, raw=False, **kwargs):
+    """
+    Count a new comment on its task. Skipped for fixture loads, which
+    bring the task with its serialized count.
+    """
+    if created and not raw:
+        Task.objects.filter(pk=instance.task_id).update(
+            comments_count=F("comments_count") + 1
+        )
+
+
+@receiver(post_delete, sender=Activity)
+def decrement_comments_count(sender, instance, origin=None, **kwargs):
+    """
+    Uncount a deleted comment. Skipped when the comment is only removed
+    as part of deleting its task or board.
+    """
+    deleted_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if deleted_model is not Activity:
+        return
+    Task.objects.filter(pk=instance.task_id, comments_count__gt=0).update(
+        comments_count=F("comments_count") - 1
+    )
+
+
+@receiver(pre_delete, sender=Column)
+def clear_task_status(sender, instance, **kwargs):
+    """
+    Tasks of a deleted column lose their column (SET_NULL) without being
+    saved, so reset their denormalized status here.
+    """
+    Task.objects.filter(column_id=instance.pk).update(status="")
@@ -1,3 +1,231 @@
-from django.test import TestCase
+import os
+import tempfile
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core import serializers
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .api.views import BULK_CREATE_MAX_TASKS
+from .models import Activity, Board, Column, Task
+
+
+class DenormalizedTaskFieldsTests(APITestCase):
+    """
+    Task.comments_count and Task.status are copies maintained by
+    signals and save() overrides; these tests pin down when they change.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user("owner", "owner@example.com", "pw")
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.column = Column.objects.create(
+            board=self.board, name="To Do", status=Column.Status.TODO
+        )
+        self.task = Task.objects.create(
+            board=self.board,
+            column=self.column,
+            title="Task",
+            priority=Task.Priority.LOW,
+        )
+
+    def comments_count(self):
+        return Task.objects.values_list("comments_count", flat=True).get(pk=self.task.pk)
+
+    def add_comment(self, content="Hallo"):
+        url = reverse("task-comments", args=[self.task.pk])
+        response = self.client.post(url, {"content": content}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data["id"]
+
+    def assert_no_comment_count_update(self, queries):
+        for query in queries.captured_queries:
+            self.assertNotIn('SET "comments_count"', query["sql"])
+
+    def test_comment_create_and_delete_adjust_count(self):
+        first = self.add_comment()
+        self.add_comment()
+        self.assertEqual(self.comments_count(), 2)
+
+        url = reverse("task-comment-delete", args=[self.task.pk, first])
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.comments_count(), 1)
+
+    def test_task_delete_does_not_decrement(self):
+        self.add_comment()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(reverse("task-detail", args=[self.task.pk]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Activity.objects.exists())
+        self.assert_no_comment_count_update(queries)
+
+    def test_board_delete_does_not_decrement(self):
+        self.add_comment()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(reverse("board-detail", args=[self.board.pk]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Task.objects.exists())
+        self.assert_no_comment_count_update(queries)
+
+    def test_stale_task_save_keeps_comments_count(self):
+        stale = Task.objects.get(pk=self.task.pk)
+        self.add_comment()
+
+        stale.title = "Umbenannt"
+        stale.save()
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, "Umbenannt")
+        self.assertEqual(self.task.comments_count, 1)
+
+    def test_fixture_load_keeps_comments_count(self):
+        self.add_comment()
+        self.add_comment()
+        objects = [Task.objects.get(pk=self.task.pk), *Activity.objects.all()]
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fixture:
+            fixture.write(serializers.serialize("json", objects))
+        self.addCleanup(os.remove, fixture.name)
+        Task.objects.filter(pk=self.task.pk).delete()
+
+        call_command("loaddata", fixture.name, verbosity=0)
+
+        self.assertEqual(Activity.objects.filter(task_id=self.task.pk).count(), 2)
+        self.assertEqual(self.comments_count(), 2)
+
+    def test_column_status_change_resyncs_task_status(self):
+        self.assertEqual(Task.objects.get(pk=self.task.pk).status, Column.Status.TODO)
+
+        column = Column.objects.get(pk=self.column.pk)
+        column.status = Column.Status.DONE
+        column.save()
+
+        self.assertEqual(Task.objects.get(pk=self.task.pk).status, Column.Status.DONE)
+
+    def test_column_delete_clears_task_status(self):
+        self.column.delete()
+
+        self.task.refresh_from_db()
+        self.assertIsNone(self.task.column_id)
+        self.assertEqual(self.task.status, "")
+
+
+class TaskBulkCreateTests(APITestCase):
+    """
+    POST /api/tasks/bulk/
+    """
+
+    url = reverse("task-bulk")
+
+    def setUp(self):
+        self.user = User.objects.create_user("owner", "owner@example.com", "pw")
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        Column.objects.create(board=self.board, name="To Do", status=Column.Status.TODO)
+
+    def task_data(self, board, title="Task"):
+        return {
+            "board": board.pk,
+            "title": title,
+            "description": "",
+            "status": "to-do",
+            "priority": "low",
+        }
+
+    def test_creates_all_tasks(self):
+        data = [self.task_data(self.board, f"Task {i}") for i in range(3)]
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([task["title"] for task in response.data], ["Task 0", "Task 1", "Task 2"])
+        self.assertEqual(Task.objects.filter(board=self.board).count(), 3)
+
+    def test_rejects_board_of_other_user(self):
+        stranger = User.objects.create_user("stranger", "stranger@example.com", "pw")
+        foreign_board = Board.objects.create(title="Fremd", owner=stranger)
+        data = [self.task_data(self.board), self.task_data(foreign_board)]
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Task.objects.exists())
+
+    def test_rejects_invalid_task(self):
+        invalid = dict(self.task_data(self.board), status="unbekannt")
+
+        response = self.client.post(self.url, [self.task_data(self.board), invalid], format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Task.objects.exists())
+
+    def test_rejects_too_many_tasks(self):
+        data = [self.task_data(self.board)] * (BULK_CREATE_MAX_TASKS + 1)
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Task.objects.exists())
+
+    def test_rejects_empty_list(self):
+        response = self.client.post(self.url, [], format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reports_missing_column_per_item(self):
+        data = [self.task_data(self.board), dict(self.task_data(self.board), status="done")]
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("status", response.data[1])
+        self.assertFalse(Task.objects.exists())
+
+    def test_query_count_does_not_grow_with_items(self):
+        member = User.objects.create_user("member", "member@example.com", "pw")
+        self.board.members.add(member)
+
+        def post(count):
+            data = [
+                dict(self.task_data(self.board), assignee_id=member.pk, reviewer_id=self.user.pk)
+                for _ in range(count)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return len(queries.captured_queries)
+
+        self.assertEqual(post(1), post(20))
+
+
+class PageCountCacheTests(APITestCase):
+    """
+    The paginated count is cached; a page beyond a stale count must
+    still be served.
+    """
+
+    url = reverse("board-list")
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("owner", "owner@example.com", "pw")
+        self.client.force_authenticate(self.user)
+        Board.objects.create(title="A", owner=self.user)
+
+    def test_page_past_cached_count_is_recounted(self):
+        response = self.client.get(self.url, {"page_size": 1})
+        self.assertEqual(response.data["count"], 1)
+        Board.objects.create(title="B", owner=self.user)
+
+        response = self.client.get(self.url, {"page_size": 1, "page": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["results"][0]["title"], "B")
@@ -0,0 +1,30 @@
+import orjson
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+
+def _default(obj):
+    """
+    Serialize lazy translation strings; everything else is unsupported.
+    """
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    raise TypeError
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+    Used for small, fixed-shape payloads (auth responses, comment lists),
+    where DRF's JSONRenderer overhead dominates the cost of the response.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=_default)
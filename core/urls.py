@@ -19,8 +19,8 @@ from django.urls import path, include
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path("api/", include("boards_app.api.urls")), 
     path("api/", include("auth_app.api.urls")),
+    path("api/", include("boards_app.api.urls")),
     path("api-auth/", include("rest_framework.urls")),
 ]
 
@@ -0,0 +1,5 @@
+def format_display_name(first_name: str, last_name: str, username: str) -> str:
+    """
+    "First Last" of a user, or the username if both names are empty.
+    """
+    return f"{first_name} {last_name}".strip() or username